@@ -0,0 +1,64 @@
+import json
+import random
+import string
+import timeit
+
+from src.data_model import DocumentData, SearchHits, SEARCH_RESULT_FIELDS
+from src.response_encoder import encode_search_response, supported_mimetypes
+
+HITS = 1000
+TEXT_LENGTH = 4000
+REPEAT = 20
+
+
+def make_hits(n=HITS, text_length=TEXT_LENGTH):
+    """构造模拟的搜索结果"""
+    rng = random.Random(0)
+    ids = list(range(n))
+    distances = sorted(rng.random() for _ in range(n))
+    texts = ["".join(rng.choices(string.ascii_letters + " ", k=text_length)) for _ in range(n)]
+    metadata = [{"source": "bench", "category": "AI", "tags": ["a", "b"], "index": i} for i in range(n)]
+    return SearchHits(ids, distances, texts=texts, metadata=metadata)
+
+
+def legacy_response(query_text, hits):
+    """旧实现：每条命中构造DocumentData，再复制为字典并用json序列化"""
+    documents = []
+    for doc_id, distance, text, meta in zip(hits.ids, hits.distances, hits.texts, hits.metadata):
+        doc = DocumentData(id=doc_id, text=text, embedding=[], metadata=meta)
+        doc.distance = distance
+        documents.append(doc)
+
+    results = []
+    for i, doc in enumerate(documents):
+        results.append({
+            "rank": i + 1,
+            "id": doc.id,
+            "text": doc.text,
+            "similarity": 1.0 - doc.distance,
+            "distance": doc.distance,
+            "metadata": doc.metadata
+        })
+    return json.dumps({"query_text": query_text, "results": results}).encode("utf-8")
+
+
+def report(name, func, size):
+    seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    print(f"{name:<55} {seconds * 1000:8.3f} ms / {HITS} hits  {size / 1024:10.1f} KiB")
+
+
+def main():
+    query_text = "人工智能和机器学习技术"
+    hits = make_hits()
+    projected = ["rank", "id", "similarity"]
+
+    report("legacy DocumentData + json", lambda: legacy_response(query_text, hits),
+           len(legacy_response(query_text, hits)))
+    for mimetype in supported_mimetypes():
+        for label, fields in (("all fields", SEARCH_RESULT_FIELDS), ("rank,id,similarity", projected)):
+            func = lambda: encode_search_response(query_text, hits, fields, mimetype)
+            report(f"SearchHits {mimetype} ({label})", func, len(func()))
+
+
+if __name__ == "__main__":
+    main()
@@ -27,3 +27,61 @@ class DocumentData:
             embedding=data_dict["embedding"],
             metadata=data_dict.get("metadata", {})
         )
+
+
+# 搜索响应中允许返回的字段，顺序即响应中字段的顺序
+SEARCH_RESULT_FIELDS = ("rank", "id", "text", "similarity", "distance", "metadata")
+
+
+class SearchHits:
+    """
+    列式存储的搜索结果，每个字段一个列表，避免为每条命中构造DocumentData对象
+    """
+    __slots__ = ("ids", "distances", "texts", "metadata")
+
+    def __init__(self, ids: List[int], distances: List[float],
+                 texts: Optional[List[str]] = None,
+                 metadata: Optional[List[Dict[str, Any]]] = None):
+        self.ids = ids
+        self.distances = distances
+        # 未查询的字段保持为None
+        self.texts = texts
+        self.metadata = metadata
+
+    def __len__(self):
+        return len(self.ids)
+
+    def columns(self, fields=SEARCH_RESULT_FIELDS) -> Dict[str, List[Any]]:
+        """按字段名返回列数据，similarity由距离转换得到"""
+        columns = {}
+        for field in fields:
+            if field == "rank":
+                columns[field] = list(range(1, len(self.ids) + 1))
+            elif field == "id":
+                columns[field] = self.ids
+            elif field == "text":
+                columns[field] = self.texts
+            elif field == "similarity":
+                columns[field] = [1.0 - d for d in self.distances]  # 转换距离为相似度
+            elif field == "distance":
+                columns[field] = self.distances
+            elif field == "metadata":
+                columns[field] = [m if m else {} for m in self.metadata]
+        return columns
+
+    def to_rows(self, fields=SEARCH_RESULT_FIELDS) -> List[Dict[str, Any]]:
+        """转换为逐条命中的字典列表，只包含指定字段"""
+        columns = self.columns(fields)
+        names = list(columns.keys())
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+    def to_documents(self) -> List[DocumentData]:
+        """转换为DocumentData列表（附带distance属性），兼容旧接口"""
+        texts = self.texts if self.texts is not None else [None] * len(self.ids)
+        metadata = self.metadata if self.metadata is not None else [{}] * len(self.ids)
+        documents = []
+        for doc_id, distance, text, meta in zip(self.ids, self.distances, texts, metadata):
+            doc = DocumentData(id=doc_id, text=text, embedding=[], metadata=meta)
+            doc.distance = distance  # 添加距离信息
+            documents.append(doc)
+        return documents
@@ -2,7 +2,7 @@ import numpy as np
 from pymilvus import Collection
 from typing import List, Dict, Any
 from src.collection_manager import MilvusCollectionManager
-from src.data_model import DocumentData
+from src.data_model import DocumentData, SearchHits
 from src.config_loader import ConfigLoader
 
 class MilvusDataReader:
@@ -48,6 +48,16 @@ class MilvusDataReader:
 
     def search_by_vector(self, query_vector: List[float], top_k: int = 10, filter_expr: str = None):
         """通过向量搜索最相似的文档"""
+        return self.search_hits(query_vector, top_k=top_k, filter_expr=filter_expr).to_documents()
+
+    def search_hits(self, query_vector: List[float], top_k: int = 10, filter_expr: str = None,
+                    output_fields: List[str] = None) -> SearchHits:
+        """
+        通过向量搜索最相似的文档，以列式SearchHits返回
+        output_fields只支持text和metadata，未请求的字段不会从Milvus取回
+        """
+        if output_fields is None:
+            output_fields = ["text", "metadata"]
         search_params = self.collection_config.get('search_params', {"nprobe": 16})
 
         results = self.collection.search(
@@ -56,23 +66,25 @@ class MilvusDataReader:
             param=search_params,
             limit=top_k,
             expr=filter_expr,
-            output_fields=["text", "metadata"]
+            output_fields=output_fields
         )
 
-        # 处理搜索结果
-        documents = []
+        # 处理搜索结果，按列收集
+        ids, distances = [], []
+        texts = [] if "text" in output_fields else None
+        metadata = [] if "metadata" in output_fields else None
         for hits in results:
+            ids.extend(hits.ids)
+            distances.extend(hits.distances)
+            if texts is None and metadata is None:
+                continue
             for hit in hits:
-                doc = DocumentData(
-                    id=hit.id,
-                    text=hit.entity.get("text"),
-                    embedding=[],  # 搜索结果通常不返回完整的向量
-                    metadata=hit.entity.get("metadata", {})
-                )
-                doc.distance = hit.distance  # 添加距离信息
-                documents.append(doc)
+                if texts is not None:
+                    texts.append(hit.entity.get("text"))
+                if metadata is not None:
+                    metadata.append(hit.entity.get("metadata") or {})
 
-        return documents
+        return SearchHits(ids, distances, texts=texts, metadata=metadata)
 
     def count_documents(self, filter_expr: str = None):
         """计算集合中的文档数量"""
@@ -1,10 +1,11 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 
 from src.collection_manager import MilvusCollectionManager
 from src.config_loader import ConfigLoader
-from src.data_model import DocumentData
+from src.data_model import DocumentData, SEARCH_RESULT_FIELDS
 from src.data_reader import MilvusDataReader
 from src.data_writer import MilvusDataWriter
+from src.response_encoder import JSON_MIMETYPE, encode_search_response, supported_mimetypes
 from src.vector_encoder import DashScopeEncoder
 
 app = Flask(__name__)
@@ -132,16 +133,29 @@ def search():
         - collection_name: 数据库名称
         - query_text: 搜索文本
         - top_k: 返回结果数量
+        - fields: 可选，返回的字段列表，默认返回全部字段
+          (rank, id, text, similarity, distance, metadata)
+    响应格式由Accept请求头决定：application/json（默认）、
+    application/msgpack、application/vnd.apache.arrow.stream（需安装对应依赖）
     """
     try:
         data = request.json
         collection_name = data.get('collection_name')
         query_text = data.get('query_text')
         top_k = data.get('top_k', 10)
+        fields = data.get('fields') or list(SEARCH_RESULT_FIELDS)
 
         if not collection_name or not query_text:
             return jsonify({"error": "缺少必要参数"}), 400
 
+        if not isinstance(fields, list):
+            return jsonify({"error": "fields参数必须是列表"}), 400
+        unknown_fields = [f for f in fields if f not in SEARCH_RESULT_FIELDS]
+        if unknown_fields:
+            return jsonify({"error": f"不支持的字段: {unknown_fields}"}), 400
+        # 去重并保持标准字段顺序
+        fields = [f for f in SEARCH_RESULT_FIELDS if f in fields]
+
         # 检查集合是否已初始化
         if collection_name not in readers:
             return jsonify({"error": f"数据库 '{collection_name}' 未初始化"}), 404
@@ -155,25 +169,15 @@ def search():
         # 生成查询向量
         query_vector = encoder.encode_text(query_text)
 
-        # 搜索相似文档
-        search_results = reader.search_by_vector(query_vector, top_k=top_k)
-
-        # 准备响应
-        results = []
-        for i, doc in enumerate(search_results):
-            results.append({
-                "rank": i + 1,
-                "id": doc.id,
-                "text": doc.text,
-                "similarity": 1.0 - doc.distance,  # 转换距离为相似度
-                "distance": doc.distance,
-                "metadata": doc.metadata
-            })
+        # 搜索相似文档，只从Milvus取回需要返回的字段
+        output_fields = [f for f in ("text", "metadata") if f in fields]
+        search_hits = reader.search_hits(query_vector, top_k=top_k, output_fields=output_fields)
 
-        return jsonify({
-            "query_text": query_text,
-            "results": results
-        })
+        # 根据Accept请求头选择响应格式
+        mimetype = request.accept_mimetypes.best_match(supported_mimetypes(), default=JSON_MIMETYPE)
+        body = encode_search_response(query_text, search_hits, fields, mimetype)
+
+        return Response(body, mimetype=mimetype)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -0,0 +1,81 @@
+import json
+from typing import List
+
+from src.data_model import SearchHits
+
+# 可选依赖：未安装时对应的响应格式不可用
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPE = "application/msgpack"
+ARROW_MIMETYPE = "application/vnd.apache.arrow.stream"
+
+
+def supported_mimetypes() -> List[str]:
+    """返回当前环境可用的响应格式，JSON始终可用且排在首位"""
+    mimetypes = [JSON_MIMETYPE]
+    if msgpack is not None:
+        mimetypes.append(MSGPACK_MIMETYPE)
+    if pyarrow is not None:
+        mimetypes.append(ARROW_MIMETYPE)
+    return mimetypes
+
+
+def encode_json(payload) -> bytes:
+    """JSON编码，优先使用orjson"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_search_response(query_text: str, hits: SearchHits, fields, mimetype: str = JSON_MIMETYPE) -> bytes:
+    """
+    将搜索结果编码为指定格式的响应体
+
+    Args:
+        query_text: 查询文本
+        hits: 列式搜索结果
+        fields: 需要返回的字段
+        mimetype: 响应格式，取自supported_mimetypes()
+
+    Returns:
+        编码后的响应体
+    """
+    if mimetype == ARROW_MIMETYPE:
+        return _encode_arrow(query_text, hits, fields)
+
+    payload = {
+        "query_text": query_text,
+        "results": hits.to_rows(fields)
+    }
+    if mimetype == MSGPACK_MIMETYPE:
+        return msgpack.packb(payload, use_bin_type=True)
+    return encode_json(payload)
+
+
+def _encode_arrow(query_text: str, hits: SearchHits, fields) -> bytes:
+    """编码为Arrow IPC流，每个字段一列，metadata列为JSON字符串"""
+    columns = hits.columns(fields)
+    if "metadata" in columns:
+        columns["metadata"] = [encode_json(m).decode("utf-8") for m in columns["metadata"]]
+
+    table = pyarrow.table(columns)
+    table = table.replace_schema_metadata({"query_text": query_text})
+
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()